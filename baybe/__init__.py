@@ -1,5 +1,6 @@
 """BayBE — A Bayesian Back End for Design of Experiments."""
 
+import gc
 import warnings
 
 # Show deprecation warnings
@@ -8,6 +9,12 @@ warnings.filterwarnings("default", category=DeprecationWarning, module="baybe")
 from baybe.campaign import Campaign
 from baybe.settings import Settings, active_settings
 
+# Collect leftover original slotted classes processed by `attrs.define`.
+# Since the package initialization always completes before any of its modules can be
+# used, a single collection covers all modules imported above. This avoids paying for
+# a full garbage collection sweep in each individual module.
+gc.collect()
+
 
 def infer_version() -> str:  # pragma: no cover
     """Determine the package version for the different ways the code can be invoked."""
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import math
 from abc import ABC
 from typing import ClassVar
@@ -482,7 +481,3 @@ class qLogNoisyExpectedHypervolumeImprovement(_ExpectedHypervolumeImprovement):
 
     prune_baseline: bool = field(default=True, validator=instance_of(bool))
     """Auto-prune candidates that are unlikely to be the best."""
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
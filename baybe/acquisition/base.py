@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC
 from typing import TYPE_CHECKING, ClassVar, Literal, overload
 
@@ -179,7 +178,3 @@ def _get_botorch_acqf_class(
         f"No BoTorch acquisition function class match found for "
         f"'{baybe_acqf_cls.__name__}'."
     )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
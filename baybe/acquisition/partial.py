@@ -45,9 +45,10 @@ class PartialAcquisitionFunction:
         # Might be necessary to insert a dummy dimension
         if partial_part.ndim == 2:
             partial_part = partial_part.unsqueeze(-2)
-        # Repeat the pinned part such that it matches the dimension of the partial_part
-        pinned_part = self.pinned_part.repeat(
-            (partial_part.shape[0], partial_part.shape[1], 1)
+        # Expand the pinned part such that it matches the dimension of the partial_part
+        # (a view suffices here since the parts are copied upon concatenation anyway)
+        pinned_part = self.pinned_part.expand(
+            partial_part.shape[0], partial_part.shape[1], -1
         )
         # Check which part is discrete and which is continuous
         if self.pin_discrete:
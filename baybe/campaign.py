@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import json
 import warnings
 from collections.abc import Callable, Collection, Sequence
@@ -971,6 +970,3 @@ _validation_converter = converter.copy()
 _validation_converter.register_structure_hook(
     SearchSpace, validate_searchspace_from_config
 )
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
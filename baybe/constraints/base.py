@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -234,7 +233,3 @@ converter.register_structure_hook_func(
     lambda c: c is Constraint, _deprecate_legacy_classes
 )
 # <<<<< Deprecation handling
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import operator as ops
 from abc import ABC, abstractmethod
 from collections.abc import Callable
@@ -226,7 +225,3 @@ class SubSelectionCondition(Condition):
     @override
     def to_polars(self, expr: pl.Expr, /) -> pl.Expr:
         return expr.is_in(self.selection)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
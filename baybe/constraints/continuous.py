@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import math
 from collections.abc import Collection, Iterable, Iterator, Sequence
 from itertools import combinations
@@ -303,7 +302,3 @@ class ContinuousCardinalityConstraint(
             lower=self.relative_threshold * bounds.lower,
             upper=self.relative_threshold * bounds.upper,
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC
 from typing import TYPE_CHECKING, Any
 
@@ -117,7 +116,3 @@ class BasicKernel(Kernel, ABC):
 @define(frozen=True)
 class CompositeKernel(Kernel, ABC):
     """Abstract base class for all composite kernels."""
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -1,6 +1,5 @@
 """Composite kernels (that is, kernels composed of other kernels)."""
 
-import gc
 from functools import reduce
 from operator import add, mul
 
@@ -80,7 +79,3 @@ class ProductKernel(CompositeKernel):
     @override
     def to_gpytorch(self, *args, **kwargs):
         return reduce(mul, (k.to_gpytorch(*args, **kwargs) for k in self.base_kernels))
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
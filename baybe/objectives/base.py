@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import warnings
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, ClassVar
@@ -289,7 +288,3 @@ class Objective(ABC, SerialMixin):
 def to_objective(x: Target | Objective, /) -> Objective:
     """Convert a target into an objective (with objective passthrough)."""
     return x if isinstance(x, Objective) else x.to_objective()
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
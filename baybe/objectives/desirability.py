@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from functools import cached_property
 from typing import TYPE_CHECKING, ClassVar, cast
 
@@ -43,8 +42,8 @@ def _geometric_mean(x: Tensor, /, weights: Tensor, dim: int = -1) -> Tensor:
 
     Args:
         x: A tensor containing the values for the mean computation.
-        weights: A tensor of weights whose shape must be broadcastable to the shape
-            of the input tensor.
+        weights: A one-dimensional tensor of weights, containing one weight per entry
+            along the specified dimension of the input tensor.
         dim: The dimension along which to compute the geometric mean.
 
     Returns:
@@ -57,14 +56,14 @@ def _geometric_mean(x: Tensor, /, weights: Tensor, dim: int = -1) -> Tensor:
         x = x.float()
 
     # Normalize weights
-    normalized_weights = weights / torch.sum(weights)
+    normalized_weights = (weights / torch.sum(weights)).to(x)
 
     # Add epsilon to avoid log(0)
     eps = torch.finfo(x.dtype).eps
     log_tensor = torch.log(x + eps)
 
-    # Compute the weighted log sum
-    weighted_log_sum = torch.sum(log_tensor * normalized_weights.unsqueeze(0), dim=dim)
+    # Compute the weighted log sum as a single matrix-vector product
+    weighted_log_sum = log_tensor.movedim(dim, -1) @ normalized_weights
 
     # Convert back from log domain
     return torch.exp(weighted_log_sum)
@@ -250,10 +249,10 @@ class DesirabilityObjective(Objective):
         if self.scalarizer is Scalarizer.MEAN:
             outer = LinearMCObjective(torch.tensor(self.normalized_weights))
         elif self.scalarizer is Scalarizer.GEOM_MEAN:
+            # Create the weight tensor once instead of in each objective evaluation
+            weights = torch.tensor(self.normalized_weights)
             outer = GenericMCObjective(
-                lambda samples, X: _geometric_mean(
-                    samples, torch.tensor(self.normalized_weights)
-                )
+                lambda samples, X: _geometric_mean(samples, weights)
             )
         else:
             raise NotImplementedError(
@@ -343,7 +342,3 @@ class DesirabilityObjective(Objective):
             )
 
         return self.transform(df, allow_missing=False, allow_extra=allow_extra)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from typing import ClassVar, NoReturn
 
 from attrs import define, field
@@ -54,7 +53,3 @@ class ParetoObjective(Objective):
             f"Objectives of type '{type(self).__name__}' do not support conversion "
             f"to BoTorch posterior transforms."
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from typing import TYPE_CHECKING, ClassVar
 
 import pandas as pd
@@ -89,7 +88,3 @@ class SingleTargetObjective(Objective):
             )
 
         return (tr.negate() if t.minimize else tr).to_botorch_posterior_transform()
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC, abstractmethod
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -154,14 +153,11 @@ class DiscreteParameter(Parameter, ABC):
             that of the input.
         """
         if self.encoding:
-            # replace each label with the corresponding encoding
-            transformed = pd.merge(
-                left=series.rename("Labels").to_frame(),
-                left_on="Labels",
-                right=self.comp_df,
-                right_index=True,
-                how="left",
-            ).drop(columns="Labels")
+            # replace each label with the corresponding encoding via a (vectorized)
+            # label-based lookup into the computational representation, whose index
+            # holds the parameter labels
+            transformed = self.comp_df.reindex(series.to_numpy())
+            transformed.index = series.index
         else:
             transformed = series.to_frame()
 
@@ -249,7 +245,3 @@ class ContinuousParameter(Parameter):
         from baybe.searchspace.continuous import SubspaceContinuous
 
         return SubspaceContinuous.from_parameter(self)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -1,6 +1,5 @@
 """Categorical parameters."""
 
-import gc
 from functools import cached_property
 
 import numpy as np
@@ -89,7 +88,3 @@ class TaskParameter(CategoricalParameter):
 
     encoding: CategoricalEncoding = field(default=CategoricalEncoding.INT, init=False)
     # See base class.
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
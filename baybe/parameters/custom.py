@@ -1,6 +1,5 @@
 """Custom parameters."""
 
-import gc
 from functools import cached_property
 from typing import Any
 
@@ -118,7 +117,3 @@ class CustomDiscreteParameter(_DiscreteLabelLikeParameter):
                 comp_df = df_uncorrelated_features(comp_df, threshold=self.decorrelate)
 
         return comp_df
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -1,6 +1,5 @@
 """Numerical parameters."""
 
-import gc
 from functools import cached_property
 from typing import Any, ClassVar
 
@@ -182,7 +181,3 @@ class _FixedNumericalContinuousParameter(ContinuousParameter):
             Type=self.__class__.__name__,
             Value=self.value,
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
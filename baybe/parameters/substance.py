@@ -1,6 +1,5 @@
 """Substance parameters."""
 
-import gc
 from functools import cached_property
 from typing import Any
 
@@ -152,7 +151,3 @@ class SubstanceParameter(_DiscreteLabelLikeParameter):
         add_noise_to_perturb_degenerate_rows(comp_df)
 
         return comp_df
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -1,6 +1,5 @@
 """Base class for all priors."""
 
-import gc
 from abc import ABC
 
 from attrs import define
@@ -31,7 +30,3 @@ class Prior(ABC, SerialMixin):
         kwargs.update(fields_dict)
 
         return prior_cls(*args, **kwargs)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -1,6 +1,5 @@
 """Base classes for all meta recommenders."""
 
-import gc
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -128,7 +127,3 @@ class MetaRecommender(SerialMixin, RecommenderProtocol, ABC):
             pending_experiments=pending_experiments,
             **optional_args,
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -3,9 +3,9 @@
 #  this file will resolve type errors
 # mypy: disable-error-code="arg-type"
 
-import gc
 from abc import abstractmethod
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
 from typing import Any, Literal, TypeVar
 
 import cattrs
@@ -301,20 +301,30 @@ class StreamingSequentialMetaRecommender(BaseSequentialMetaRecommender):
         return to_string(self.__class__.__name__, *fields)
 
 
+@cache
+def _make_privates_unstructure_fn(cls: type, /) -> Callable[[Any], dict[str, Any]]:
+    """Generate (once per class) a function unstructuring private attributes."""
+    return cattrs.gen.make_dict_unstructure_fn(
+        cls, converter, _cattrs_include_init_false=True
+    )
+
+
+@cache
+def _make_privates_structure_fn(cls: type[_T], /) -> Callable[[dict[str, Any]], _T]:
+    """Generate (once per class) a function structuring private attributes."""
+    return cattrs.gen.make_dict_structure_fn(
+        cls, converter, _cattrs_include_init_false=True
+    )
+
+
 def _unstructure_privates(x: Any) -> dict[str, Any]:
     """Unstructure an object with its private attributes."""
-    fn = cattrs.gen.make_dict_unstructure_fn(
-        type(x), converter, _cattrs_include_init_false=True
-    )
-    return fn(x)
+    return _make_privates_unstructure_fn(type(x))(x)
 
 
 def _structure_privates(x: dict[str, Any], cls: type[_T]) -> _T:
     """Structure an object with its private attributes."""
-    fn = cattrs.gen.make_dict_structure_fn(
-        cls, converter, _cattrs_include_init_false=True
-    )
-    return fn(x)
+    return _make_privates_structure_fn(cls)(x)
 
 
 # Register (un-)structure hooks
@@ -332,6 +342,3 @@ converter.register_unstructure_hook(
 converter.register_structure_hook(
     StreamingSequentialMetaRecommender, block_deserialization_hook
 )
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
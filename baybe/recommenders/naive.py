@@ -1,6 +1,5 @@
 """Naive recommender for hybrid spaces."""
 
-import gc
 from typing import ClassVar
 
 import pandas as pd
@@ -147,7 +146,3 @@ class NaiveHybridSpaceRecommender(PureRecommender):
         rec_cont.index = rec_disc_exp.index
         rec_exp = pd.concat([rec_disc_exp, rec_cont], axis=1)
         return rec_exp
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
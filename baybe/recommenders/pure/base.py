@@ -1,6 +1,5 @@
 """Base classes for all pure recommenders."""
 
-import gc
 from abc import ABC
 from collections.abc import Callable
 from typing import Any, ClassVar, NoReturn
@@ -288,23 +287,13 @@ class PureRecommender(ABC, RecommenderProtocol):
 @converter.register_unstructure_hook_factory(lambda x: issubclass(x, PureRecommender))
 def _(cls: type[PureRecommender]) -> Callable[[PureRecommender], dict[str, Any]]:
     """Deprecation mechanism for allow_* flags."""  # noqa: D401
-
-    def drop_deprecated_flags(obj: PureRecommender, /) -> dict[str, Any]:
-        fn = make_dict_unstructure_fn(
-            cls,
-            converter,
-            _deprecated_allow_repeated_recommendations=cattrs.override(omit=True),
-            _deprecated_allow_recommending_already_measured=cattrs.override(omit=True),
-            _deprecated_allow_recommending_pending_experiments=cattrs.override(
-                omit=True
-            ),
-        )
-        if is_abstract(cls):
-            fn = add_type(fn)
-        return fn(obj)
-
-    return drop_deprecated_flags
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
+    fn = make_dict_unstructure_fn(
+        cls,
+        converter,
+        _deprecated_allow_repeated_recommendations=cattrs.override(omit=True),
+        _deprecated_allow_recommending_already_measured=cattrs.override(omit=True),
+        _deprecated_allow_recommending_pending_experiments=cattrs.override(omit=True),
+    )
+    if is_abstract(cls):
+        fn = add_type(fn)
+    return fn
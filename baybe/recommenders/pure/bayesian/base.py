@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import warnings
 from abc import ABC
 from typing import TYPE_CHECKING
@@ -276,7 +275,3 @@ class BayesianRecommender(PureRecommender, ABC):
             pending_experiments,
             jointly=True,
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import math
 import warnings
 from collections.abc import Collection, Iterable
@@ -581,7 +580,3 @@ class BotorchRecommender(BayesianRecommender):
         acqf_value = acqf_values_all[best_idx]
 
         return points, acqf_value
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
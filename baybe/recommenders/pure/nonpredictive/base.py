@@ -1,6 +1,5 @@
 """Base class for all nonpredictive recommenders."""
 
-import gc
 import warnings
 from abc import ABC
 
@@ -56,7 +55,3 @@ class NonPredictiveRecommender(PureRecommender, ABC):
             measurements=measurements,
             pending_experiments=None,
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
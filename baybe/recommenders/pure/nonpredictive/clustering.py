@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, ClassVar
 
@@ -302,7 +301,3 @@ class GaussianMixtureClusteringRecommender(SKLearnClusteringRecommender):
 
             selection.append(np.argmax(density).item())
         return selection
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
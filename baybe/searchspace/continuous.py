@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import math
 from collections.abc import Collection, Iterator, Sequence
 from itertools import chain, product
@@ -672,6 +671,3 @@ class SubspaceContinuous(SerialMixin):
 
 # Register deserialization hook
 converter.register_structure_hook(SubspaceContinuous, select_constructor_hook)
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from collections.abc import Iterable, Sequence
 from enum import Enum
 from typing import cast
@@ -435,6 +434,3 @@ def validate_searchspace_from_config(specs: dict, _) -> None:
 
 # Register deserialization hook
 converter.register_structure_hook(SearchSpace, select_constructor_hook)
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
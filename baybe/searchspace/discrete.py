@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from collections.abc import Collection, Sequence
 from itertools import compress
 from math import prod
@@ -790,6 +789,3 @@ def validate_simplex_subspace_from_config(specs: dict, _) -> None:
 
 # Register deserialization hook
 converter.register_structure_hook(SubspaceDiscrete, select_constructor_hook)
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
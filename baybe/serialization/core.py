@@ -101,7 +101,9 @@ def _structure_dataframe_hook(obj: str | dict, _) -> pd.DataFrame:
 
 def _unstructure_dataframe_hook(df: pd.DataFrame) -> str:
     """Serialize a DataFrame."""
-    pickled_df = pickle.dumps(df)
+    # Protocol 5 serializes the underlying array buffers more efficiently than the
+    # default protocol and can be read by all supported Python versions
+    pickled_df = pickle.dumps(df, protocol=5)
     return base64.b64encode(pickled_df).decode("utf-8")
 
 
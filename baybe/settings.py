@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import os
 import tempfile
 import warnings
@@ -200,6 +199,13 @@ class Settings(_SlottedContextDecorator):
     )
     """Controls if `fpsample <https://github.com/leonardodalinky/fpsample>`_ acceleration is to be used, if available."""  # noqa: E501
 
+    _use_gpu: AutoBool = field(
+        alias="use_gpu",
+        default=AutoBool.FALSE,
+        converter=AutoBool.from_unstructured,  # type: ignore[misc]
+    )
+    """Controls if Gaussian process models are fitted on the GPU."""
+
     _use_polars_for_constraints: AutoBool = field(
         alias="use_polars_for_constraints",
         default=AutoBool.AUTO,
@@ -271,6 +277,18 @@ class Settings(_SlottedContextDecorator):
                 _MISSING_PACKAGE_ERROR_MESSAGE.format(package_name="fpsample")
             )
 
+    @_use_gpu.validator
+    def _validate_use_gpu(self, _, value: AutoBool) -> None:
+        if value is not AutoBool.TRUE:
+            return
+
+        import torch
+
+        if not torch.cuda.is_available():
+            raise ValueError(
+                "GPU usage was requested but no CUDA-capable device is available."
+            )
+
     @property
     def use_polars_for_constraints(self) -> bool:
         """Indicates if ``polars`` is enabled (i.e., installed and set to be used)."""
@@ -291,6 +309,18 @@ class Settings(_SlottedContextDecorator):
         # Note: uses attrs converter
         self._use_fpsample = value  # type: ignore[assignment]
 
+    @property
+    def use_gpu(self) -> bool:
+        """Indicates if the GPU is enabled (i.e., available and set to be used)."""
+        import torch
+
+        return self._use_gpu.evaluate(torch.cuda.is_available)
+
+    @use_gpu.setter
+    def use_gpu(self, value: AutoBool | bool, /) -> None:
+        # Note: uses attrs converter
+        self._use_gpu = value  # type: ignore[assignment]
+
     @property
     def DTypeFloatNumpy(self) -> type[np.floating]:
         """The floating point precision used for ``numpy`` arrays."""
@@ -303,6 +333,13 @@ class Settings(_SlottedContextDecorator):
 
         return torch.float32 if self.use_single_precision_torch else torch.float64
 
+    @property
+    def DeviceTorch(self) -> torch.device:
+        """The device used for ``torch`` model fitting."""
+        import torch
+
+        return torch.device("cuda" if self.use_gpu else "cpu")
+
     @classproperty
     def _non_settings_names(cls) -> frozenset[str]:
         """The names of attributes that do not represent user-facing settings."""  # noqa: D401
@@ -392,9 +429,6 @@ class Settings(_SlottedContextDecorator):
 # ensure that the attribute exists as a sanity check (in case of future name edits)
 assert _RANDOM_SEED_ATTRIBUTE_NAME in (fld.name for fld in fields(Settings))
 
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
-
 
 active_settings = Settings(restore_environment=True)
 """The current active settings."""
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from enum import Enum, auto
@@ -489,13 +488,15 @@ class IndependentGaussianSurrogate(Surrogate, ABC):
                 f"Requested batch size: {batch_size}"
             )
 
-        import torch
         from botorch.posteriors import GPyTorchPosterior
         from gpytorch.distributions import MultivariateNormal
+        from linear_operator.operators import DiagLinearOperator
 
-        # Construct the Gaussian posterior from the estimated first and second moment
+        # Construct the Gaussian posterior from the estimated first and second moment.
+        # The diagonal covariance is represented lazily to avoid materializing a dense
+        # matrix on every posterior call.
         mean, var = self._estimate_moments(candidates_comp_scaled)
-        mvn = MultivariateNormal(mean, torch.diag_embed(var))
+        mvn = MultivariateNormal(mean, DiagLinearOperator(var))
         return GPyTorchPosterior(mvn)
 
     @abstractmethod
@@ -503,7 +504,3 @@ class IndependentGaussianSurrogate(Surrogate, ABC):
         self, candidates_comp_scaled: Tensor, /
     ) -> tuple[Tensor, Tensor]:
         """Estimate first and second moments of the Gaussian posterior."""
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from collections.abc import Sequence
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
@@ -219,10 +218,6 @@ def _unstructure_surrogate_getter(obj: _SurrogateGetter) -> dict:
     return converter.unstructure(obj, unstructure_as=container_type)
 
 
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
-
-
 converter.register_structure_hook_func(
     lambda t: t is _SurrogateGetter, _structure_surrogate_getter
 )
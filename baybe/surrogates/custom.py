@@ -10,7 +10,6 @@ It is planned to solve this issue in the future.
 
 from __future__ import annotations
 
-import gc
 from typing import TYPE_CHECKING, Any, ClassVar, NoReturn
 
 import cattrs
@@ -182,7 +181,3 @@ def _encode_onnx_string(dct: dict[str, Any], _) -> CustomONNXSurrogate:
         ),
     )
     return fn(dct)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
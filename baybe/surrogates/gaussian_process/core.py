@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import gc
+import warnings
 from typing import TYPE_CHECKING, ClassVar
 
 from attrs import define, field
@@ -11,6 +11,7 @@ from typing_extensions import override
 
 from baybe.parameters.base import Parameter
 from baybe.searchspace.core import SearchSpace
+from baybe.settings import active_settings
 from baybe.surrogates.base import Surrogate
 from baybe.surrogates.gaussian_process.kernel_factory import (
     KernelFactory,
@@ -27,10 +28,12 @@ from baybe.surrogates.gaussian_process.presets.default import (
 from baybe.utils.conversion import to_string
 
 if TYPE_CHECKING:
+    import torch
     from botorch.models.gpytorch import GPyTorchModel
     from botorch.models.transforms.input import InputTransform
     from botorch.models.transforms.outcome import OutcomeTransform
     from botorch.posteriors import Posterior
+    from gpytorch.mlls import MarginalLogLikelihood
     from torch import Tensor
 
 
@@ -74,6 +77,36 @@ class _ModelContext:
         return tuple(i for i in range(n_inputs) if i != self.task_idx)
 
 
+def _fit_mll(mll: MarginalLogLikelihood, device: torch.device) -> None:
+    """Fit the model attached to a marginal log likelihood on the given device.
+
+    The model is fitted in the configured floating point precision. If single
+    precision was requested and the fit runs on a GPU, TF32 matrix multiplications are
+    enabled and the fit is repeated once in double precision if it fails for numerical
+    reasons.
+    """
+    import botorch
+    import torch
+    from botorch.exceptions.errors import ModelFittingError
+    from linear_operator.utils.errors import NotPSDError
+
+    dtype = active_settings.DTypeFloatTorch
+    mll.to(device=device, dtype=dtype)
+    if not (dtype == torch.float32 and device.type == "cuda"):
+        botorch.fit.fit_gpytorch_mll(mll)
+        return
+
+    precision = torch.get_float32_matmul_precision()
+    torch.set_float32_matmul_precision("high")
+    try:
+        botorch.fit.fit_gpytorch_mll(mll)
+    except (NotPSDError, ModelFittingError):
+        mll.to(dtype=torch.float64)
+        botorch.fit.fit_gpytorch_mll(mll)
+    finally:
+        torch.set_float32_matmul_precision(precision)
+
+
 @define
 class GaussianProcessSurrogate(Surrogate):
     """A Gaussian process surrogate model."""
@@ -194,7 +227,9 @@ class GaussianProcessSurrogate(Surrogate):
         likelihood = gpytorch.likelihoods.GaussianLikelihood(
             noise_prior=noise_prior[0].to_gpytorch(), batch_shape=batch_shape
         )
-        likelihood.noise = torch.tensor([noise_prior[1]])
+        likelihood.noise = torch.tensor(
+            [noise_prior[1]], dtype=train_x.dtype, device=train_x.device
+        )
 
         # construct and fit the Gaussian process
         self._model = botorch.models.SingleTaskGP(
@@ -218,7 +253,24 @@ class GaussianProcessSurrogate(Surrogate):
                 self._model.likelihood, self._model
             )
 
-        botorch.fit.fit_gpytorch_mll(mll)
+        # Fit the model on the configured device, falling back to CPU in case the
+        # accelerator runs out of memory. Afterwards, the model is moved back to CPU
+        # so that it can be consumed by the (CPU-based) acquisition function pipeline.
+        device = active_settings.DeviceTorch
+        if device.type == "cuda" and not torch.cuda.is_available():
+            warnings.warn(
+                "GPU usage was requested but no CUDA-capable device is available. "
+                "Falling back to CPU-based model fitting.",
+                UserWarning,
+            )
+            device = torch.device("cpu")
+        try:
+            _fit_mll(mll, device)
+        except torch.cuda.OutOfMemoryError:
+            torch.cuda.empty_cache()
+            _fit_mll(mll, torch.device("cpu"))
+        finally:
+            self._model.to(device="cpu", dtype=active_settings.DTypeFloatTorch)
 
     @override
     def __str__(self) -> str:
@@ -226,7 +278,3 @@ class GaussianProcessSurrogate(Surrogate):
             to_string("Kernel factory", self.kernel_factory, single_line=True),
         ]
         return to_string(super().__str__(), *fields)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from typing import TYPE_CHECKING, Protocol
 
 from attrs import define, field
@@ -44,7 +43,3 @@ class PlainKernelFactory(KernelFactory, SerialMixin):
 def to_kernel_factory(x: Kernel | KernelFactory, /) -> KernelFactory:
     """Wrap a kernel into a plain kernel factory (with factory passthrough)."""
     return x.to_factory() if isinstance(x, Kernel) else x
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -91,7 +90,3 @@ def _default_noise_factory(
         ),
         np.interp(effective_dims, _DIM_LIMITS, [0.1, 5.0]).item(),
     )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
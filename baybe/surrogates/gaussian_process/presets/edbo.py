@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from collections.abc import Collection
 from typing import TYPE_CHECKING
 
@@ -44,6 +43,60 @@ _EDBO_ENCODINGS = (
 """Encodings relevant to EDBO logic."""
 
 
+@define(frozen=True)
+class _EDBOPriorProfile:
+    """The prior settings of an EDBO regime."""
+
+    lengthscale_prior: tuple[float, float]
+    """The concentration and rate of the lengthscale Gamma prior."""
+
+    lengthscale_initial_value: float
+    """The initial lengthscale value."""
+
+    outputscale_prior: tuple[float, float]
+    """The concentration and rate of the outputscale Gamma prior."""
+
+    outputscale_initial_value: float
+    """The initial outputscale value."""
+
+    noise_prior: tuple[float, float]
+    """The concentration and rate of the noise Gamma prior."""
+
+    noise_initial_value: float
+    """The initial noise value."""
+
+
+_EDBO_PRIOR_PROFILES: dict[str, _EDBOPriorProfile] = {
+    "low_d": _EDBOPriorProfile((1.2, 1.1), 0.2, (5.0, 0.5), 8.0, (1.05, 0.5), 0.1),
+    "dft": _EDBOPriorProfile((2.0, 0.2), 5.0, (5.0, 0.5), 8.0, (1.5, 0.1), 5.0),
+    "mordred": _EDBOPriorProfile((2.0, 0.1), 10.0, (2.0, 0.1), 10.0, (1.5, 0.1), 5.0),
+    "ohe": _EDBOPriorProfile((3.0, 1.0), 2.0, (5.0, 0.2), 20.0, (1.5, 0.1), 5.0),
+}
+"""The prior settings of the EDBO regimes."""
+
+
+def _get_edbo_prior_profile(
+    searchspace: SearchSpace, train_x: Tensor
+) -> _EDBOPriorProfile:
+    """Select the EDBO prior settings applicable to the given modelling context."""
+    effective_dims = train_x.shape[-1] - len(
+        [p for p in searchspace.parameters if isinstance(p, TaskParameter)]
+    )
+
+    # Low D priors
+    if effective_dims < 5:
+        return _EDBO_PRIOR_PROFILES["low_d"]
+
+    # OHE optimized priors
+    if effective_dims < 50 or not _contains_encoding(
+        searchspace.discrete, _EDBO_ENCODINGS
+    ):
+        return _EDBO_PRIOR_PROFILES["ohe"]
+
+    # DFT or Mordred optimized priors
+    return _EDBO_PRIOR_PROFILES["dft" if effective_dims < 100 else "mordred"]
+
+
 @define
 class EDBOKernelFactory(KernelFactory):
     """A factory providing the kernel for Gaussian process surrogates adapted from EDBO.
@@ -57,50 +110,16 @@ class EDBOKernelFactory(KernelFactory):
     def __call__(
         self, searchspace: SearchSpace, train_x: Tensor, train_y: Tensor
     ) -> Kernel:
-        effective_dims = train_x.shape[-1] - len(
-            [p for p in searchspace.parameters if isinstance(p, TaskParameter)]
-        )
-
-        switching_condition = _contains_encoding(
-            searchspace.discrete, _EDBO_ENCODINGS
-        ) and (effective_dims >= 50)
-
-        # low D priors
-        if effective_dims < 5:
-            lengthscale_prior = GammaPrior(1.2, 1.1)
-            lengthscale_initial_value = 0.2
-            outputscale_prior = GammaPrior(5.0, 0.5)
-            outputscale_initial_value = 8.0
-
-        # DFT optimized priors
-        elif switching_condition and effective_dims < 100:
-            lengthscale_prior = GammaPrior(2.0, 0.2)
-            lengthscale_initial_value = 5.0
-            outputscale_prior = GammaPrior(5.0, 0.5)
-            outputscale_initial_value = 8.0
-
-        # Mordred optimized priors
-        elif switching_condition:
-            lengthscale_prior = GammaPrior(2.0, 0.1)
-            lengthscale_initial_value = 10.0
-            outputscale_prior = GammaPrior(2.0, 0.1)
-            outputscale_initial_value = 10.0
-
-        # OHE optimized priors
-        else:
-            lengthscale_prior = GammaPrior(3.0, 1.0)
-            lengthscale_initial_value = 2.0
-            outputscale_prior = GammaPrior(5.0, 0.2)
-            outputscale_initial_value = 20.0
+        profile = _get_edbo_prior_profile(searchspace, train_x)
 
         return ScaleKernel(
             MaternKernel(
                 nu=2.5,
-                lengthscale_prior=lengthscale_prior,
-                lengthscale_initial_value=lengthscale_initial_value,
+                lengthscale_prior=GammaPrior(*profile.lengthscale_prior),
+                lengthscale_initial_value=profile.lengthscale_initial_value,
             ),
-            outputscale_prior=outputscale_prior,
-            outputscale_initial_value=outputscale_initial_value,
+            outputscale_prior=GammaPrior(*profile.outputscale_prior),
+            outputscale_initial_value=profile.outputscale_initial_value,
         )
 
 
@@ -116,30 +135,5 @@ def _edbo_noise_factory(
         * https://doi.org/10.1038/s41586-021-03213-y
     """
     # TODO: Replace this function with a proper likelihood factory
-    effective_dims = train_x.shape[-1] - len(
-        [p for p in searchspace.parameters if isinstance(p, TaskParameter)]
-    )
-
-    switching_condition = _contains_encoding(
-        searchspace.discrete, _EDBO_ENCODINGS
-    ) and (effective_dims >= 50)
-
-    # low D priors
-    if effective_dims < 5:
-        return (GammaPrior(1.05, 0.5), 0.1)
-
-    # DFT optimized priors
-    elif switching_condition and effective_dims < 100:
-        return (GammaPrior(1.5, 0.1), 5.0)
-
-    # Mordred optimized priors
-    elif switching_condition:
-        return (GammaPrior(1.5, 0.1), 5.0)
-
-    # OHE optimized priors
-    else:
-        return (GammaPrior(1.5, 0.1), 5.0)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
+    profile = _get_edbo_prior_profile(searchspace, train_x)
+    return (GammaPrior(*profile.noise_prior), profile.noise_initial_value)
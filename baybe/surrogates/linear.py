@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import gc
 from typing import TYPE_CHECKING, ClassVar, TypedDict
 
+import numpy as np
 from attrs import define, field
 from typing_extensions import override
 
@@ -71,13 +71,13 @@ class BayesianLinearSurrogate(IndependentGaussianSurrogate):
         import torch
 
         # Get predictions
-        dists = self._model.predict(candidates_comp_scaled.numpy(), return_std=True)
+        mean, std = self._model.predict(candidates_comp_scaled.numpy(), return_std=True)
 
-        # Split into posterior mean and variance
-        mean = torch.from_numpy(dists[0])
-        var = torch.from_numpy(dists[1]).pow(2)
+        # Convert to posterior mean and variance (squaring in-place avoids an extra
+        # allocation on the tensor side)
+        var = np.square(std, out=std)
 
-        return mean, var
+        return torch.from_numpy(mean), torch.from_numpy(var)
 
     @override
     def _fit(self, train_x: Tensor, train_y: Tensor) -> None:
@@ -90,7 +90,3 @@ class BayesianLinearSurrogate(IndependentGaussianSurrogate):
     def __str__(self) -> str:
         fields = [to_string("Model Params", self.model_params, single_line=True)]
         return to_string(super().__str__(), *fields)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-import gc
 from typing import TYPE_CHECKING, ClassVar
 
 from attrs import define, field
 from typing_extensions import override
 
 from baybe.surrogates.base import IndependentGaussianSurrogate
-from baybe.surrogates.utils import batchify_mean_var_prediction
 
 if TYPE_CHECKING:
     from torch import Tensor
@@ -30,21 +28,23 @@ class MeanPredictionSurrogate(IndependentGaussianSurrogate):
     """The estimated posterior mean value of the training targets."""
 
     @override
-    @batchify_mean_var_prediction
     def _estimate_moments(
         self, candidates_comp_scaled: Tensor, /
     ) -> tuple[Tensor, Tensor]:
         import torch
 
+        # Since the moments do not depend on the candidate values, they can be directly
+        # created in the required batch shape, without the need for batchification
         # TODO: use target value bounds for covariance scaling when explicitly provided
-        mean = self._model * torch.ones([len(candidates_comp_scaled)])  # type: ignore[operator]
-        var = torch.ones(len(candidates_comp_scaled))
+        mean = torch.full(
+            candidates_comp_scaled.shape[:-1],
+            self._model,  # type: ignore[arg-type]
+            dtype=candidates_comp_scaled.dtype,
+            device=candidates_comp_scaled.device,
+        )
+        var = torch.ones_like(mean)
         return mean, var
 
     @override
     def _fit(self, train_x: Tensor, train_y: Tensor) -> None:
         self._model = train_y.mean().item()
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
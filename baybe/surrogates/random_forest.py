@@ -51,9 +51,9 @@ class _RandomForestRegressorParams(TypedDict, total=False):
 
 
 class _Predictor(Protocol):
-    """A basic predictor."""
+    """A basic predictor with optional input validation."""
 
-    def predict(self, x: np.ndarray, /) -> np.ndarray: ...
+    def predict(self, x: np.ndarray, /, check_input: bool = ...) -> np.ndarray: ...
 
 
 @catch_constant_targets
@@ -109,7 +109,9 @@ class RandomForestSurrogate(Surrogate):
 
             return torch.from_numpy(
                 self._predict_ensemble(
-                    self._model.estimators_, candidates_comp_scaled.numpy()
+                    self._model.estimators_,
+                    candidates_comp_scaled.numpy(),
+                    n_jobs=self._model.n_jobs,
                 )
             )
 
@@ -117,17 +119,37 @@ class RandomForestSurrogate(Surrogate):
 
     @staticmethod
     def _predict_ensemble(
-        predictors: Collection[_Predictor], candidates: np.ndarray
+        predictors: Collection[_Predictor],
+        candidates: np.ndarray,
+        n_jobs: int | None = None,
     ) -> np.ndarray:
-        """Evaluate an ensemble of predictors on a given candidate set."""
-        # Extract shapes
-        n_candidates = len(candidates)
-        n_estimators = len(predictors)
-
-        # Evaluate all trees
-        predictions = np.zeros((n_estimators, n_candidates))
-        for p, predictor in enumerate(predictors):
-            predictions[p] = predictor.predict(candidates)
+        """Evaluate an ensemble of predictors on a given candidate set.
+
+        Args:
+            predictors: The predictors forming the ensemble.
+            candidates: The candidates to be evaluated.
+            n_jobs: The number of threads used for evaluating the predictors.
+                Follows the conventions of :class:`joblib.Parallel`.
+
+        Returns:
+            An array of shape ``(n_estimators, n_candidates)`` holding the predictions.
+        """
+        from joblib import Parallel, delayed
+
+        # The trees operate in single precision internally, so we convert the
+        # candidates once upfront instead of letting each tree validate and convert
+        # them separately
+        candidates = np.ascontiguousarray(candidates, dtype=np.float32)
+
+        # Evaluate all trees, writing into a preallocated buffer
+        predictions = np.empty((len(predictors), len(candidates)))
+
+        def predict(p: int, predictor: _Predictor) -> None:
+            predictions[p] = predictor.predict(candidates, check_input=False)
+
+        Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(predict)(p, predictor) for p, predictor in enumerate(predictors)
+        )
 
         return predictions
 
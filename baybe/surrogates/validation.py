@@ -103,11 +103,13 @@ def make_dict_validator(specification: type) -> Callable:
     Returns:
         An attrs compatible validator.
     """
+    # Resolve the structure hook once instead of dispatching on every validation call
+    structure = type_validation_converter.get_structure_hook(specification)
 
     def validate_model_params(_instance: Any, attr: Any, value: dict) -> None:
         """Validate attrs attribute using cattrs with an extremely strict int hook."""
         try:
-            type_validation_converter.structure(value, specification)
+            structure(value, specification)
         except ClassValidationError as ex:
             raise TypeError(
                 f"The provided dictionary for '{attr.name}' is invalid."
@@ -1,6 +1,5 @@
 """Numerical targets."""
 
-import gc
 import warnings
 from collections.abc import Callable, Sequence
 from enum import Enum
@@ -217,10 +216,6 @@ class LegacyTarget(Target, SerialMixin):
         return target_dict
 
 
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
-
-
 def linear_transform(
     arr: ArrayLike, lower: float, upper: float, descending: bool
 ) -> np.ndarray:
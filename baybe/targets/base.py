@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
@@ -73,7 +72,3 @@ class Target(ABC, SerialMixin):
     @override
     def __str__(self) -> str:
         return str(self.summary())
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
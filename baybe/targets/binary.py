@@ -1,6 +1,5 @@
 """Binary targets."""
 
-import gc
 import warnings
 from typing import TypeAlias
 
@@ -106,7 +105,3 @@ class BinaryTarget(Target, SerialMixin):
             Success_value=self.success_value,
             Failure_value=self.failure_value,
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
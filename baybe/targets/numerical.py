@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import inspect
 import warnings
 from collections.abc import Sequence
@@ -765,9 +764,6 @@ class NumericalTarget(Target, SerialMixin):
         )
 
 
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
-
 converter.register_unstructure_hook(
     NumericalTarget,
     cattrs.gen.make_dict_unstructure_fn(
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -233,7 +232,3 @@ class MonotonicTransformation(Transformation, ABC):
                 ]
             )
         )
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
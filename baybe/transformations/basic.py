@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
@@ -514,7 +513,3 @@ class SigmoidTransformation(MonotonicTransformation):
 def _(dct, _) -> ClampingTransformation:
     cutoffs = Interval(**dct["cutoffs"])
     return ClampingTransformation(*cutoffs.to_tuple())
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import inspect
 from functools import reduce
 from typing import TYPE_CHECKING, Any
@@ -137,7 +136,3 @@ class MultiplicativeTransformation(Transformation):
     @override
     def __call__(self, x: Tensor, /) -> Tensor:
         return self.transformations[0](x) * self.transformations[1](x)
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -28,31 +28,59 @@ def name_to_smiles(name: str) -> str:
     throw exceptions for invalid molecules but instead returns an empty string for
     easy subsequent postprocessing of the dataframe.
 
+    Successful lookups are cached in memory and on disk (see
+    :attr:`baybe.settings.Settings.cache_directory`), so that repeated queries for the
+    same name do not trigger additional network requests.
+
     Args:
         name: Name or nickname of compound.
 
     Returns:
         SMILES string corresponding to chemical name.
     """
-    name = name.replace(" ", "%20")
-
     try:
-        url = "http://cactus.nci.nih.gov/chemical/structure/" + name + "/smiles"
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
+        return _resolve_name_to_smiles(name)
+    except Exception:
+        return ""
 
-        with urllib.request.urlopen(url, context=ctx) as web:
-            smiles = web.read().decode("utf8")
 
-        smiles = str(smiles)
-        if "</div>" in smiles:
-            return ""
+@lru_cache(maxsize=None)
+@cache_to_disk
+def _resolve_name_to_smiles(name: str) -> str:
+    """Query the chemical identifier resolver for the SMILES of a chemical name.
 
-        return smiles
+    Failed lookups raise an exception and are thus never cached.
 
-    except Exception:
-        return ""
+    Args:
+        name: Name or nickname of compound.
+
+    Raises:
+        ValueError: If the resolver does not return a SMILES string for the name.
+
+    Returns:
+        SMILES string corresponding to chemical name.
+    """
+    url = (
+        "http://cactus.nci.nih.gov/chemical/structure/"
+        + name.replace(" ", "%20")
+        + "/smiles"
+    )
+    with urllib.request.urlopen(url, context=_get_unverified_ssl_context()) as web:
+        smiles = str(web.read().decode("utf8"))
+
+    if "</div>" in smiles:
+        raise ValueError(f"No SMILES could be resolved for the name '{name}'.")
+
+    return smiles
+
+
+@lru_cache(maxsize=None)
+def _get_unverified_ssl_context() -> ssl.SSLContext:
+    """Get the (shared) SSL context used for querying the identifier resolver."""
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
 
 
 @lru_cache(maxsize=None)
@@ -87,7 +115,10 @@ def smiles_to_fingerprint_features(
         encoding: Encoding used to transform SMILES to fingerprints.
         prefix: Name prefix for each descriptor (e.g., nBase --> <prefix>_nBase).
         kwargs_conformer: kwargs for conformer generator
-        kwargs_fingerprint: kwargs for fingerprint generator
+        kwargs_fingerprint: kwargs for fingerprint generator. If an ``n_jobs`` value
+            other than ``None`` or ``1`` is provided, the fingerprints of all
+            molecules are computed in parallel as a single batch, bypassing the
+            per-molecule cache.
 
     Returns:
         Dataframe containing fingerprints for each SMILES string.
@@ -124,12 +155,24 @@ def smiles_to_fingerprint_features(
     else:
         mol_list = smiles
 
-    features = np.concatenate(
-        [
-            _molecule_to_fingerprint_features(mol, fingerprint_encoder)
-            for mol in mol_list
-        ]
-    )
+    if fingerprint_encoder.n_jobs in (None, 1):
+        # Stack the per-molecule features into a single block, casting to the target
+        # dtype in the same pass to avoid an intermediate copy of the full matrix
+        features = np.concatenate(
+            [
+                _molecule_to_fingerprint_features(mol, fingerprint_encoder)
+                for mol in mol_list
+            ],
+            dtype=active_settings.DTypeFloatNumpy,
+        )
+    else:
+        # If parallelization is requested, the molecules are passed to the encoder in a
+        # single batch so that they can be distributed across its worker processes.
+        # Dispatching the cached per-molecule computation instead would spin up the
+        # workers once for each individual molecule.
+        features = fingerprint_encoder.transform(mol_list).astype(
+            active_settings.DTypeFloatNumpy, copy=False
+        )
     name = f"{encoding.name}_"
     prefix = prefix + "_" if prefix else ""
     feature_names_out = fingerprint_encoder.get_feature_names_out()
@@ -139,11 +182,7 @@ def smiles_to_fingerprint_features(
         for f in feature_names_out
     ]
     col_names = [prefix + name + suffix for suffix in suffixes]
-    df = pd.DataFrame(
-        features, columns=col_names, dtype=active_settings.DTypeFloatNumpy
-    )
-
-    return df
+    return pd.DataFrame(features, columns=col_names, copy=False)
 
 
 def get_fingerprint_class(encoding: SubstanceEncoding) -> BaseFingerprintTransformer:
@@ -176,8 +215,28 @@ def get_fingerprint_class(encoding: SubstanceEncoding) -> BaseFingerprintTransfo
 
 
 def get_canonical_smiles(smiles: str) -> str:
-    """Return the "canonical" representation of the given SMILES."""
-    try:
-        return Chem.MolToSmiles(Chem.MolFromSmiles(smiles))
-    except Exception:
+    """Return the "canonical" representation of the given SMILES.
+
+    Raises:
+        ValueError: If the given SMILES is not a string or cannot be parsed.
+    """
+    if not isinstance(smiles, str):
+        raise ValueError(f"The SMILES '{smiles}' does not appear to be valid.")
+
+    return _canonicalize(smiles)
+
+
+@lru_cache(maxsize=None)
+def _canonicalize(smiles: str, /) -> str:
+    """Canonicalize a SMILES string.
+
+    Results are cached since the same SMILES are validated each time a substance
+    parameter is created (e.g. also upon deserialization).
+    """
+    mol = Chem.MolFromSmiles(smiles)
+
+    # RDKit signals unparsable SMILES by returning `None` rather than raising
+    if mol is None:
         raise ValueError(f"The SMILES '{smiles}' does not appear to be valid.")
+
+    return Chem.MolToSmiles(mol)
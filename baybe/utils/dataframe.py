@@ -69,9 +69,13 @@ def to_tensor(*x: _ConvertibleToTensor) -> Tensor | tuple[Tensor, ...]:
                 # subsequent numpy-to-torch conversion to fail. This happens, for
                 # example, when the dataframe contains Boolean and integer columns.
 
+                # The stride check is done on the converted array itself, which
+                # avoids materializing an additional (possibly `object`) array
+                array = x.to_numpy(numpy_dtype)
+
                 # tensors with negative strides are not supported by PyTorch
-                fix_strides = any(s < 0 for s in x.to_numpy().strides)
-                array = x.to_numpy(numpy_dtype, copy=fix_strides)
+                if any(s < 0 for s in array.strides):
+                    array = array.copy()
                 tensor = torch.from_numpy(array)
             case _:
                 assert_never(x)
@@ -151,20 +155,30 @@ def add_parameter_noise(
             "'absolute' or 'relative_percent'."
         )
 
-    for param in (p for p in parameters if p.is_numerical):
-        # Add selected noise type
-        if noise_type == "relative_percent":
-            data[param.name] *= np.random.uniform(
-                1.0 - noise_level / 100.0, 1.0 + noise_level / 100.0, len(data)
-            )
-        elif noise_type == "absolute":
-            data[param.name] += np.random.uniform(-noise_level, noise_level, len(data))
-
-        # Respect continuous intervals
-        if param.is_continuous:
-            data[param.name] = data[param.name].clip(
-                param.bounds.lower, param.bounds.upper
-            )
+    numerical = [p for p in parameters if p.is_numerical]
+    if not numerical:
+        return data
+    names = [p.name for p in numerical]
+
+    # Draw the noise for all parameters at once. The samples are drawn per parameter
+    # and transposed afterward so that the random stream matches the one obtained when
+    # drawing separately for each parameter.
+    size = (len(numerical), len(data))
+    if noise_type == "relative_percent":
+        data[names] *= np.random.uniform(
+            1.0 - noise_level / 100.0, 1.0 + noise_level / 100.0, size
+        ).T
+    elif noise_type == "absolute":
+        data[names] += np.random.uniform(-noise_level, noise_level, size).T
+
+    # Respect continuous intervals
+    if continuous := [p for p in numerical if p.is_continuous]:
+        names = [p.name for p in continuous]
+        data[names] = data[names].clip(
+            [p.bounds.lower for p in continuous],
+            [p.bounds.upper for p in continuous],
+            axis=1,
+        )
 
     return data
 
@@ -230,15 +244,11 @@ def df_drop_single_value_columns(
     Returns:
         The cleaned dataframe.
     """
-    if lst_exclude is None:
-        lst_exclude = []
+    to_keep = df.nunique() > 1
+    if lst_exclude is not None:
+        to_keep |= df.columns.isin(lst_exclude)
 
-    to_keep = []
-    for col in df.columns:
-        if (col in lst_exclude) or (df[col].nunique() > 1):
-            to_keep.append(col)
-
-    return df[to_keep]
+    return df.loc[:, to_keep]
 
 
 def df_drop_string_columns(
@@ -255,11 +265,19 @@ def df_drop_string_columns(
         The cleaned dataframe.
     """
     ignore_list = ignore_list or []
-    no_string = ~df.applymap(lambda x: isinstance(x, str)).any()
-    no_string = no_string[no_string].index
-    to_keep = set(no_string).union(set(ignore_list))
-    ordered_cols = [col for col in df if col in to_keep]
-    return df[ordered_cols]
+
+    def contains_strings(series: pd.Series, /) -> bool:
+        # Numerical columns cannot hold strings, so only the remaining ones
+        # (e.g. of object/string/categorical type) need an element-wise check
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            return False
+        return series.map(lambda x: isinstance(x, str)).any()
+
+    to_keep = [
+        (col in ignore_list) or not contains_strings(series)
+        for col, series in df.items()
+    ]
+    return df.loc[:, to_keep]
 
 
 def df_uncorrelated_features(
@@ -281,19 +299,17 @@ def df_uncorrelated_features(
     """
     # TODO: revise or replace with VRE method
 
-    if exclude_list is None:
-        data = df.copy()
-    else:
-        data = df.drop(columns=exclude_list)
-
-    corr = data.corr().abs()
-    to_keep = []
-    for i in range(len(corr.iloc[:, 0])):
-        above = corr.iloc[:i, i]
-        if len(to_keep) > 0:
-            above = above[to_keep]
-        if len(above[above < threshold]) == len(above):
-            to_keep.append(corr.columns.values[i])
+    data = df if exclude_list is None else df.drop(columns=exclude_list)
+
+    # Greedily keep each column whose correlation with all previously kept columns
+    # stays below the threshold. Working on the raw correlation matrix with a boolean
+    # mask avoids label-based pandas indexing in the loop. Note that NaN correlations
+    # (e.g. caused by constant columns) never pass the threshold check.
+    corr = data.corr().abs().to_numpy()
+    keep = np.zeros(len(corr), dtype=bool)
+    for i in range(len(corr)):
+        keep[i] = (corr[:i, i][keep[:i]] < threshold).all()
+    to_keep = data.columns[keep]
 
     data = data[to_keep]
 
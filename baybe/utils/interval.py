@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import builtins
-import gc
 from collections.abc import Iterable
 from copy import deepcopy
 from functools import singledispatchmethod
@@ -179,6 +178,3 @@ def use_fallback_constructor_hook(value: Any, cls: type[Interval]) -> Interval:
 
 # Register structure hooks
 converter.register_structure_hook(Interval, use_fallback_constructor_hook)
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import cache
 from typing import Any, TypeVar
 
 import cattrs
@@ -115,11 +117,15 @@ def _separate_metadata_fields(dct: dict[str, Any], cls: type[Metadata]) -> Metad
     return cls(**explicit, misc=dct)
 
 
+@cache
+def _make_metadata_unstructure_fn(cls: type[Metadata], /) -> Callable:
+    """Generate (once per class) the default unstructure function for metadata."""
+    return cattrs.gen.make_dict_unstructure_fn(cls, converter)
+
+
 @converter.register_unstructure_hook
 def _flatten_misc_metadata(metadata: Metadata) -> dict[str, Any]:
     """Flatten the metadata for serialization."""
-    cls = type(metadata)
-    fn = cattrs.gen.make_dict_unstructure_fn(cls, converter)
-    dct = fn(metadata)
+    dct = _make_metadata_unstructure_fn(type(metadata))(metadata)
     dct = dct | dct.pop(fields(Metadata).misc.name)
     return dct
@@ -141,32 +141,27 @@ def farthest_point_sampling(
         inv_sort_idx = np.argsort(sort_idx)
         selected_point_indices = [inv_sort_idx[x] for x in initialization]
 
-    # Initialize the list of remaining points
-    remaining_point_indices = list(range(n_points))
-    for idx in selected_point_indices:
-        remaining_point_indices.remove(idx)
+    # Track for each point its smallest distance to the selected points. Since the
+    # diagonal of the distance matrix is set to -inf, already selected points are
+    # automatically excluded from the selection.
+    min_dists = np.min(dist_matrix[:, selected_point_indices], axis=1)
 
     # Successively add the points with the largest distance
     while len(selected_point_indices) < n_samples:
-        # Collect distances between selected and remaining points
-        dist = dist_matrix[np.ix_(remaining_point_indices, selected_point_indices)]
-
-        # Find for each candidate point the smallest distance to the selected points
-        min_dists = np.min(dist, axis=1)
         max_val = np.max(min_dists)
-        max_indices = np.where(min_dists == max_val)[0]
+        max_indices = np.flatnonzero(min_dists == max_val)
 
         if random_tie_break:
             # Select a random point that has the "largest smallest distance"
-            choice = np.random.choice(max_indices)
+            selected_point_index = np.random.choice(max_indices)
         else:
             # Choose the last point with the "largest smallest distance"
-            choice = max_indices[-1]
-        selected_point_index = remaining_point_indices[choice]
+            selected_point_index = max_indices[-1]
 
-        # Add the chosen point to the selection
-        selected_point_indices.append(selected_point_index)
-        remaining_point_indices.remove(selected_point_index)
+        # Add the chosen point to the selection and update the smallest distances,
+        # which only requires the distances to the newly selected point
+        selected_point_indices.append(int(selected_point_index))
+        np.minimum(min_dists, dist_matrix[:, selected_point_index], out=min_dists)
 
     # Undo the initial point reordering
     return sort_idx[selected_point_indices].tolist()
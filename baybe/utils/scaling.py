@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import gc
 import itertools
 from typing import TYPE_CHECKING
 
@@ -70,7 +69,3 @@ class ColumnTransformer:
         for cols, transformer in self.mapping.items():
             out[..., cols] = transformer(out[..., cols])
         return out
-
-
-# Collect leftover original slotted classes processed by `attrs.define`
-gc.collect()
@@ -187,16 +187,12 @@ def validate_parameter_input(
             )
 
         # Check if all rows have valid inputs matching allowed parameter values
-        for ind, row in data.iterrows():
-            valid = True
-            if p.is_numerical:
-                if numerical_measurements_must_be_within_tolerance:
-                    valid &= p.is_in_range(row[p.name])
-            else:
-                valid &= p.is_in_range(row[p.name])
-            if not valid:
+        if p.is_numerical and not numerical_measurements_must_be_within_tolerance:
+            continue
+        for ind, value in data[p.name].items():
+            if not p.is_in_range(value):
                 raise ValueError(
-                    f"Input data on row with the index {row.name} has invalid "
+                    f"Input data on row with the index {ind} has invalid "
                     f"values in parameter '{p.name}'. "
                     f"For categorical parameters, values need to exactly match a "
                     f"valid choice defined in your config. "
@@ -5,6 +5,7 @@
 import argparse
 import os
 from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from benchmarks.definition import Benchmark, RunMode
@@ -66,16 +67,30 @@ def run_benchmarks(
                             generated file name.
         save: Whether to save the results to the object storage.
     """
-    for benchmark in benchmark_list:
-        result = benchmark(runmode=runmode)
-
-        if save:
-            save_benchmark_data(
-                benchmark,
-                result,
-                file_name_prefix=file_name_prefix,
-                outdir=outdir,
-            )
+    # Results are persisted in a background thread so that the (I/O-bound) upload
+    # of one result overlaps with the (CPU-bound) execution of the next benchmark.
+    # A single worker keeps the writes in order and avoids competing with the
+    # process-level parallelism used for the simulation runs themselves.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: Future | None = None
+        for benchmark in benchmark_list:
+            result = benchmark(runmode=runmode)
+
+            if save:
+                # Surface errors of the previous save before continuing, so that a
+                # broken storage setup does not go unnoticed until all benchmarks ran
+                if pending is not None:
+                    pending.result()
+                pending = executor.submit(
+                    save_benchmark_data,
+                    benchmark,
+                    result,
+                    file_name_prefix=file_name_prefix,
+                    outdir=outdir,
+                )
+
+        if pending is not None:
+            pending.result()
 
 
 def main() -> None:
@@ -6,6 +6,7 @@ import time
 from abc import ABC
 from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import Any, Generic, TypeVar
 
 import attrs
@@ -151,12 +152,16 @@ class Benchmark(Generic[BenchmarkSettingsType], BenchmarkSerialization):
         return Result(self.name, result, metadata, used_settings.runmode)
 
 
+@cache
+def _make_benchmark_unstructure_fn(cls: type[Benchmark], /) -> Callable:
+    """Generate (once per class) the unstructure function for benchmark fields."""
+    return make_dict_unstructure_fn(cls, converter, function=override(omit=True))
+
+
 @converter.register_unstructure_hook
 def unstructure_benchmark(benchmark: Benchmark) -> dict:
     """Unstructure a benchmark instance."""
-    fn = make_dict_unstructure_fn(
-        type(benchmark), converter, function=override(omit=True)
-    )
+    fn = _make_benchmark_unstructure_fn(type(benchmark))
     return {
         "name": benchmark.name,
         "description": benchmark.description,
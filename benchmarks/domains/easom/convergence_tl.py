@@ -22,28 +22,25 @@ from benchmarks.definition import (
 from benchmarks.definition.base import RunMode
 
 
-def easom(x: np.ndarray, noise_std: float = 0.0, negate: bool = False):
+def easom(x: np.ndarray, noise_std: float = 0.0, negate: bool = False) -> np.ndarray:
     """Eason function output values.
 
     Args:
-        x: Input with two features
+        x: Input array of shape ``(n, 2)``, with one row per evaluation point.
         noise_std: Noise to be added to output.
         negate: Whether to invert the output
 
     Returns:
-        Easom function output
+        Easom function outputs of shape ``(n,)``.
     """
-    x = np.array(x).ravel()
-    assert x.shape == (2,)
-    y = (
-        -math.cos(x[0])
-        * math.cos(x[1])
-        * math.exp(-((x[0] - math.pi) ** 2) - (x[1] - math.pi) ** 2)
-    )
+    x = np.atleast_2d(x)
+    assert x.shape[1] == 2
+    x0, x1 = x.T
+    y = -np.cos(x0) * np.cos(x1) * np.exp(-((x0 - math.pi) ** 2) - (x1 - math.pi) ** 2)
     if negate:
         y = y * -1
     if noise_std > 0:
-        y += np.random.normal(loc=0.0, scale=noise_std, size=1)[0]
+        y += np.random.normal(loc=0.0, scale=noise_std, size=len(y))
     return y
 
 
@@ -115,9 +112,8 @@ def easom_tl_47_negate_noise5(settings: ConvergenceBenchmarkSettings) -> pd.Data
             lookup = pd.DataFrame(
                 {f"x{d}": grid_d.ravel() for d, grid_d in enumerate(meshgrid)}
             )
-            lookup["Target"] = lookup.apply(
-                function, axis=1
-            )  # Randomness from source function
+            # Randomness from source function
+            lookup["Target"] = function(lookup.to_numpy())
             lookup["Function"] = function_name
             lookups.append(lookup)
         concat_lookups = pd.concat(lookups)
@@ -7,12 +7,11 @@ a noise_std of 0.15 to the source function.
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
 
 import numpy as np
 import pandas as pd
 import torch
-from botorch.test_functions.synthetic import Michalewicz
+from botorch.test_functions.synthetic import Michalewicz, SyntheticTestFunction
 
 from baybe.campaign import Campaign
 from baybe.objectives import SingleTargetObjective
@@ -53,33 +52,31 @@ def make_objective() -> SingleTargetObjective:
 
 
 def wrap_function(
-    function: Callable, function_name: str, df: pd.DataFrame
+    function: SyntheticTestFunction, function_name: str, df: pd.DataFrame
 ) -> pd.DataFrame:
     """Wrap the given function such that it operates on DataFrames."""
-    input_columns = df.columns.tolist()
-
     # Create a copy to avoid modifying the original DataFrame
     result_df = df.copy()
 
-    # Apply Michalewicz function to each row
-    def apply_function(row):
-        # Remove the "Function" column but record its value such that it can be added
-        # back to the row after the function evaluation
-        if "Function" in row.index:
-            function_value = row["Function"]
-            row = row.drop("Function")
-        else:
-            function_value = None  # Default if column doesn't exist
-
-        x = torch.tensor(row.values.astype(float), dtype=torch.float64).unsqueeze(0)
-        # Re-add the "Function" column to the row
-        if function_value is not None:
-            row["Function"] = function_value
-        return function(x).item()
-
-    result_df["Target"] = (
-        result_df[input_columns].apply(apply_function, axis=1).astype(float)
+    # Evaluate the noise-free function on all rows at once, ignoring the "Function"
+    # column
+    x = torch.tensor(
+        df.drop(columns="Function", errors="ignore").to_numpy(dtype=float),
+        dtype=torch.float64,
     )
+    y = function.evaluate_true(x)
+
+    # Torch draws larger batches of normal samples differently than single values.
+    # To keep the seeded data identical to a row-wise evaluation, the noise is thus
+    # drawn value by value.
+    if function.noise_std is not None:
+        noise = torch.cat([torch.randn(1, dtype=y.dtype) for _ in range(len(y))])
+        y = y + function.noise_std * noise
+    if function.negate:
+        y = -y
+
+    result_df["Target"] = y.numpy()
+
     # Add a column "Function" with the function name
     result_df["Function"] = function_name
 
@@ -87,7 +84,7 @@ def wrap_function(
 
 
 def make_initial_data(
-    function: Callable,
+    function: SyntheticTestFunction,
     function_name: str,
     num_of_points: int,
 ) -> pd.DataFrame:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -25,22 +26,31 @@ if TYPE_CHECKING:
     from mpl_toolkits.mplot3d import Axes3D
 
 
+_BRANCHES: dict[int, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    1: lambda x, y: sin(x) * (1 + sin(y)),
+    2: lambda x, y: x * sin(0.9 * x) + sin(x) * sin(y),
+    3: lambda x, y: sqrt(x + 8) * sin(x) + sin(x) * sin(y),
+    4: lambda x, y: x * sin(1.666 * sqrt(x + 8)) + sin(x) * sin(y),
+}
+"""The objective function branches, indexed by the value of the discrete input."""
+
+
 def _lookup(arr: np.ndarray, /) -> np.ndarray:
     """Numpy-based lookup callable defining the objective function."""
     x, y, z = np.array_split(arr, 3, axis=1)
     try:
         assert np.all(-2 * pi <= x) and np.all(x <= 2 * pi)
         assert np.all(-2 * pi <= y) and np.all(y <= 2 * pi)
-        assert np.all(np.isin(z, [1, 2, 3, 4]))
+        assert np.all(np.isin(z, list(_BRANCHES)))
     except AssertionError:
         raise ValueError("Inputs are not in the valid ranges.")
 
-    return (
-        (z == 1) * sin(x) * (1 + sin(y))
-        + (z == 2) * (x * sin(0.9 * x) + sin(x) * sin(y))
-        + (z == 3) * (sqrt(x + 8) * sin(x) + sin(x) * sin(y))
-        + (z == 4) * (x * sin(1.666 * sqrt(x + 8)) + sin(x) * sin(y))
-    )
+    # Evaluate each branch only on the inputs selecting it
+    out = np.empty(x.shape)
+    for value, branch in _BRANCHES.items():
+        mask = z == value
+        out[mask] = branch(x[mask], y[mask])
+    return out
 
 
 def lookup(df: pd.DataFrame, /) -> pd.DataFrame:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 from datetime import datetime
@@ -172,6 +173,8 @@ class S3ObjectStorage(ObjectStorage):
 
         The S3-key of the JSON is created from
         the path_constructor. If the key already exists, it will be overwritten.
+        Large payloads are transferred as multipart uploads with concurrently
+        uploaded parts, using the default transfer configuration of ``boto3``.
 
         Args:
             object: The object to be persisted.
@@ -181,11 +184,11 @@ class S3ObjectStorage(ObjectStorage):
 
         key = path_constructor.get_path(strategy=PathStrategy.HIERARCHICAL)
 
-        client.put_object(
+        client.upload_fileobj(
+            io.BytesIO(json.dumps(object).encode()),
             Bucket=self._bucket_name,
             Key=key.as_posix(),
-            Body=json.dumps(object),
-            ContentType="application/json",
+            ExtraArgs={"ContentType": "application/json"},
         )
 
 
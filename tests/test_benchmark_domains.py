@@ -0,0 +1,49 @@
+"""Tests for the benchmark domains."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+from botorch.test_functions.synthetic import Michalewicz
+
+pytest.importorskip("git", reason="Benchmarks require the benchmarking extras.")
+pytest.importorskip("boto3", reason="Benchmarks require the benchmarking extras.")
+
+from benchmarks.domains.michalewicz.convergence_tl import (  # noqa: E402
+    wrap_function,
+)
+
+
+def _wrap_function_rowwise(function, function_name, df):
+    """Reference implementation evaluating the function row by row."""
+    result_df = df.copy()
+    x = df.drop(columns="Function", errors="ignore").to_numpy(dtype=float)
+    result_df["Target"] = [
+        function(torch.tensor(row, dtype=torch.float64).unsqueeze(0)).item()
+        for row in x
+    ]
+    result_df["Function"] = function_name
+    return result_df
+
+
+@pytest.mark.parametrize("n_rows", [1, 16, 50, 100])
+@pytest.mark.parametrize("noise_std", [None, 0.15], ids=["noiseless", "noisy"])
+@pytest.mark.parametrize("with_function_column", [False, True])
+def test_michalewicz_batched_evaluation(
+    n_rows: int, noise_std: float | None, with_function_column: bool
+):
+    """Batched evaluation reproduces the seeded values of a row-wise evaluation."""
+    function = Michalewicz(dim=5, negate=True, noise_std=noise_std)
+    df = pd.DataFrame(
+        np.random.default_rng(0).uniform(0, np.pi, (n_rows, 5)),
+        columns=[f"x{k}" for k in range(5)],
+    )
+    if with_function_column:
+        df["Function"] = "Source_Function"
+
+    torch.manual_seed(1337)
+    expected = _wrap_function_rowwise(function, "Source_Function", df)
+    torch.manual_seed(1337)
+    actual = wrap_function(function, "Source_Function", df)
+
+    pd.testing.assert_frame_equal(actual, expected)
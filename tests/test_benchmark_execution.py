@@ -0,0 +1,56 @@
+"""Tests for the benchmark execution."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("git", reason="Benchmarks require the benchmarking extras.")
+pytest.importorskip("boto3", reason="Benchmarks require the benchmarking extras.")
+
+import benchmarks.__main__ as benchmark_main  # noqa: E402
+
+
+class _FakeBenchmark:
+    """A stand-in benchmark that records its executions."""
+
+    def __init__(self, name: str, executed: list[str]):
+        self.name = name
+        self._executed = executed
+
+    def __call__(self, runmode):
+        self._executed.append(self.name)
+        return f"result_{self.name}"
+
+
+def test_results_are_saved_in_order(monkeypatch):
+    """All benchmark results are persisted in execution order."""
+    executed: list[str] = []
+    saved: list[str] = []
+    monkeypatch.setattr(
+        benchmark_main,
+        "save_benchmark_data",
+        lambda benchmark, result, **kwargs: saved.append(result),
+    )
+    benchmarks = [_FakeBenchmark(str(k), executed) for k in range(3)]
+
+    benchmark_main.run_benchmarks(benchmarks, None, Path("."))
+
+    assert executed == ["0", "1", "2"]
+    assert saved == ["result_0", "result_1", "result_2"]
+
+
+def test_failing_save_stops_execution(monkeypatch):
+    """A failing save aborts the run before further benchmarks are started."""
+    executed: list[str] = []
+
+    def fail(benchmark, result, **kwargs):
+        raise OSError("Storage not available")
+
+    monkeypatch.setattr(benchmark_main, "save_benchmark_data", fail)
+    benchmarks = [_FakeBenchmark(str(k), executed) for k in range(5)]
+
+    with pytest.raises(OSError, match="Storage not available"):
+        benchmark_main.run_benchmarks(benchmarks, None, Path("."))
+
+    # The error of the first save surfaces right after the second benchmark
+    assert executed == ["0", "1"]
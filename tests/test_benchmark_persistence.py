@@ -0,0 +1,41 @@
+"""Tests for the persistence of benchmark results."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("git", reason="Benchmarks require the benchmarking extras.")
+pytest.importorskip("boto3", reason="Benchmarks require the benchmarking extras.")
+
+from benchmarks.persistence.persistence import (  # noqa: E402
+    VARNAME_BENCHMARKING_PERSISTENCE_PATH,
+    PathStrategy,
+    S3ObjectStorage,
+)
+
+
+def test_s3_upload(monkeypatch):
+    """Results are uploaded as JSON to the key provided by the path constructor."""
+    monkeypatch.setenv(VARNAME_BENCHMARKING_PERSISTENCE_PATH, "my-bucket")
+    session = MagicMock()
+    client = session.client.return_value
+    path_constructor = MagicMock()
+    path_constructor.get_path.return_value = Path("a/b/result.json")
+    result = {"name": "benchmark", "values": [1, 2.5, None]}
+
+    S3ObjectStorage(object_session=session).write_json(result, path_constructor)
+
+    session.client.assert_called_once_with("s3")
+    path_constructor.get_path.assert_called_once_with(
+        strategy=PathStrategy.HIERARCHICAL
+    )
+    client.upload_fileobj.assert_called_once()
+    (fileobj,), kwargs = client.upload_fileobj.call_args
+    assert kwargs == {
+        "Bucket": "my-bucket",
+        "Key": "a/b/result.json",
+        "ExtraArgs": {"ContentType": "application/json"},
+    }
+    assert fileobj.getvalue() == json.dumps(result).encode()
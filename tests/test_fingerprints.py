@@ -54,3 +54,21 @@ def test_fingerprint_kwargs(encoding, kw_fp, kw_conf):
             "The fingerprint dimension parameter was ignored, fingerprints have a "
             "wrong number of dimensions."
         )
+
+
+@pytest.mark.skipif(
+    not CHEM_INSTALLED, reason="Optional chem dependency not installed."
+)
+@pytest.mark.parametrize("encoding", [ECFP, SubstanceEncoding.MORDRED])
+def test_parallel_fingerprint_computation(encoding):
+    """Parallel batch computation yields the same features as the cached path."""
+    import pandas as pd
+
+    from baybe.utils.chemistry import smiles_to_fingerprint_features
+
+    smiles = ["CC(N(C)C)=O", "CCCC#N", "c1ccccc1O"]
+    sequential = smiles_to_fingerprint_features(smiles, encoding)
+    parallel = smiles_to_fingerprint_features(
+        smiles, encoding, kwargs_fingerprint={"n_jobs": 2}
+    )
+    pd.testing.assert_frame_equal(sequential, parallel)
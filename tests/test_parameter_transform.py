@@ -0,0 +1,56 @@
+"""Tests for the transformation of parameter values to computational representation."""
+
+import pandas as pd
+import pytest
+from pytest import param
+
+from baybe.parameters import (
+    CategoricalParameter,
+    CustomDiscreteParameter,
+    TaskParameter,
+)
+
+_INDEX = pd.Index([7, 3, 42, 3], name="custom")
+
+
+@pytest.mark.parametrize(
+    ("parameter", "labels"),
+    [
+        param(
+            CategoricalParameter("p", ["a", "b", "c"]), ["c", "a", "b", "c"], id="ohe"
+        ),
+        param(
+            CategoricalParameter("p", ["a", "b", "c"], encoding="INT"),
+            ["b", "b", "a", "c"],
+            id="int",
+        ),
+        param(TaskParameter("p", ["x", "y"]), ["y", "x", "x", "y"], id="task"),
+        param(
+            CustomDiscreteParameter(
+                "p", pd.DataFrame({"d": [1.0, 2.0]}, index=["u", "v"])
+            ),
+            ["v", "u", "v", "u"],
+            id="custom",
+        ),
+    ],
+)
+def test_transform_preserves_index(parameter, labels):
+    """Transformed values keep the (non-default) index of the input series."""
+    series = pd.Series(labels, index=_INDEX, name=parameter.name)
+    transformed = parameter.transform(series)
+
+    pd.testing.assert_index_equal(transformed.index, _INDEX)
+    pd.testing.assert_frame_equal(
+        transformed.reset_index(drop=True),
+        parameter.comp_df.loc[labels].reset_index(drop=True),
+    )
+
+
+def test_transform_unknown_labels():
+    """Labels without a computational representation are mapped to NaN."""
+    parameter = CategoricalParameter("p", ["a", "b"])
+    series = pd.Series(["a", "z"], index=[5, 9], name="p")
+    transformed = parameter.transform(series)
+
+    assert transformed.loc[9].isna().all()
+    assert not transformed.loc[5].isna().any()
@@ -37,6 +37,7 @@ INVALID_VALUES: dict[str, tuple[Any, type[Exception], str]] = {
     "preprocess_dataframes": (0, TypeError, "must be <class 'bool'>"),
     "random_seed": (0.0, TypeError, "must be <class 'int'>"),
     "use_fpsample": (0, ValueError, "Cannot convert '0' to 'AutoBool'"),
+    "use_gpu": (0, ValueError, "Cannot convert '0' to 'AutoBool'"),
     "use_polars_for_constraints": (0, ValueError, "Cannot convert '0' to 'AutoBool'"),
     "use_single_precision_numpy": (0, TypeError, "must be <class 'bool'>"),
     "use_single_precision_torch": (0, TypeError, "must be <class 'bool'>"),
@@ -72,8 +73,11 @@ def toggle(value: Any, /) -> Any:
 
 def assert_attribute_values(obj: Any, attributes: dict[str, Any], /) -> None:
     """Assert that the attributes of an object match the expected values."""
+    # Compare the configured values rather than their evaluated counterparts exposed
+    # via properties (e.g. `AUTO` for `use_gpu` may evaluate to `False`)
+    alias_to_name = {fld.alias: fld.name for fld in Settings._settings_attributes}
     for key, expected in attributes.items():
-        actual = getattr(obj, key)
+        actual = getattr(obj, alias_to_name.get(key, key))
         assert actual == expected, (
             f"Attribute '{key}' expected to be '{expected}' but got '{actual}'."
         )
@@ -243,6 +247,21 @@ def test_setting_via_decorator(original_values, toggled_values):
     assert_attribute_values(active_settings, original_values)
 
 
+def test_gpu_unavailable(monkeypatch):
+    """Requesting GPU usage without an available CUDA device raises an error."""
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+    match = "no CUDA-capable device is available"
+    with pytest.raises(ValueError, match=match):
+        Settings(use_gpu=True)
+    with pytest.raises(ValueError, match=match):
+        active_settings.use_gpu = True
+
+    # Automatic detection gracefully falls back to the CPU
+    with Settings(use_gpu="auto"):
+        assert active_settings.use_gpu is False
+        assert active_settings.DeviceTorch == torch.device("cpu")
+
+
 def test_unknown_environment_variable(monkeypatch):
     """Unknown environment variables raise an error upon settings instantiation."""
     monkeypatch.setenv("BAYBE_UNKNOWN_SETTING", "True")
@@ -4,8 +4,10 @@ import os
 from contextlib import nullcontext
 from unittest.mock import patch
 
+import botorch
 import pandas as pd
 import pytest
+import torch
 from pytest import param
 
 from baybe.exceptions import IncompatibleSurrogateError
@@ -16,6 +18,7 @@ from baybe.objectives.single import SingleTargetObjective
 from baybe.parameters.numerical import NumericalDiscreteParameter
 from baybe.recommenders.pure.bayesian.botorch import BotorchRecommender
 from baybe.searchspace.core import SearchSpace
+from baybe.settings import Settings
 from baybe.surrogates import (
     BayesianLinearSurrogate,
     MeanPredictionSurrogate,
@@ -24,7 +27,11 @@ from baybe.surrogates import (
 from baybe.surrogates.base import IndependentGaussianSurrogate, Surrogate
 from baybe.surrogates.composite import CompositeSurrogate
 from baybe.surrogates.custom import CustomONNXSurrogate
-from baybe.surrogates.gaussian_process.core import GaussianProcessSurrogate
+from baybe.surrogates.gaussian_process import core as gp_core
+from baybe.surrogates.gaussian_process.core import (
+    GaussianProcessSurrogate,
+    _fit_mll,
+)
 from baybe.surrogates.random_forest import RandomForestSurrogate
 from baybe.targets.numerical import NumericalTarget
 from baybe.utils.basic import get_subclasses, is_all_instance
@@ -235,3 +242,95 @@ def test_batching_incompatibility(
         match="cannot be used for joint posterior evaluation",
     ):
         surrogate.posterior(measurements, joint=True)
+
+
+class _FakeMLL:
+    """A stand-in marginal log likelihood that records its device/dtype moves."""
+
+    def __init__(self):
+        self.moves: list[dict] = []
+
+    def to(self, **kwargs):
+        self.moves.append(kwargs)
+        return self
+
+
+@pytest.mark.parametrize(
+    ("device", "single_precision", "expected_dtypes"),
+    [
+        param("cuda", True, [torch.float32, torch.float64], id="gpu-single"),
+        param("cpu", True, [torch.float32], id="cpu-single"),
+        param("cuda", False, [torch.float64], id="gpu-double"),
+    ],
+)
+def test_gp_fit_precision_retry(
+    monkeypatch, device: str, single_precision: bool, expected_dtypes: list
+):
+    """Failed single-precision GPU fits are retried once in double precision."""
+    from linear_operator.utils.errors import NotPSDError
+
+    calls = []
+
+    def fit(mll):
+        calls.append(torch.get_float32_matmul_precision())
+        if len(calls) == 1:
+            raise NotPSDError("Matrix not positive definite")
+
+    monkeypatch.setattr(botorch.fit, "fit_gpytorch_mll", fit)
+    mll = _FakeMLL()
+    precision = torch.get_float32_matmul_precision()
+
+    with Settings(use_single_precision_torch=single_precision):
+        if len(expected_dtypes) == 1:
+            # Without a retry, the fitting error is propagated
+            with pytest.raises(NotPSDError):
+                _fit_mll(mll, torch.device(device))
+        else:
+            _fit_mll(mll, torch.device(device))
+
+    assert [m["dtype"] for m in mll.moves] == expected_dtypes
+    assert len(calls) == len(expected_dtypes)
+    if len(expected_dtypes) > 1:
+        assert set(calls) == {"high"}
+    assert torch.get_float32_matmul_precision() == precision
+
+
+def test_gp_fit_out_of_memory_fallback(monkeypatch):
+    """GP fits that exhaust GPU memory are repeated on the CPU."""
+    devices = []
+
+    def fit_mll(mll, device):
+        devices.append(device.type)
+        if device.type == "cuda":
+            raise torch.cuda.OutOfMemoryError("CUDA out of memory")
+        _fit_mll(mll, device)
+
+    monkeypatch.setattr(gp_core, "_fit_mll", fit_mll)
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    searchspace = NumericalDiscreteParameter("p", [0, 1, 2]).to_searchspace()
+    objective = NumericalTarget("t").to_objective()
+    measurements = create_fake_input(searchspace.parameters, objective.targets, 3)
+
+    with Settings(use_gpu=True):
+        surrogate = GaussianProcessSurrogate()
+        surrogate.fit(searchspace, objective, measurements)
+
+    assert devices == ["cuda", "cpu"]
+    assert surrogate.to_botorch().train_inputs[0].device.type == "cpu"
+
+
+def test_gp_fit_unavailable_gpu_fallback(monkeypatch):
+    """GP fits fall back to the CPU if the requested GPU is not usable."""
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+    searchspace = NumericalDiscreteParameter("p", [0, 1, 2]).to_searchspace()
+    objective = NumericalTarget("t").to_objective()
+    measurements = create_fake_input(searchspace.parameters, objective.targets, 3)
+
+    with Settings(use_gpu=True):
+        # The device becomes unavailable after the settings have been validated
+        monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+        surrogate = GaussianProcessSurrogate()
+        with pytest.warns(UserWarning, match="Falling back to CPU"):
+            surrogate.fit(searchspace, objective, measurements)
+
+    assert surrogate.to_botorch().train_inputs[0].device.type == "cpu"
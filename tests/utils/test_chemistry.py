@@ -0,0 +1,71 @@
+"""Tests for chemistry utilities."""
+
+import pytest
+
+from baybe._optional.info import CHEM_INSTALLED
+
+pytestmark = pytest.mark.skipif(
+    not CHEM_INSTALLED, reason="Optional chem dependency not installed."
+)
+
+if CHEM_INSTALLED:
+    from baybe.utils import chemistry
+
+
+class _FakeResponse:
+    """A stand-in for the response of a web request."""
+
+    def __init__(self, content: str):
+        self._content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def read(self) -> bytes:
+        return self._content.encode("utf8")
+
+
+@pytest.fixture(name="requested_urls")
+def fixture_requested_urls(monkeypatch):
+    """Redirect name lookups to a fake web service, recording the requested URLs."""
+    urls: list[str] = []
+
+    def urlopen(url, **kwargs):
+        urls.append(url)
+        if "unknown" in url:
+            return _FakeResponse("<div>Page not found</div>")
+        return _FakeResponse("CCO")
+
+    monkeypatch.setattr(chemistry.urllib.request, "urlopen", urlopen)
+    chemistry._resolve_name_to_smiles.cache_clear()
+    yield urls
+    chemistry._resolve_name_to_smiles.cache_clear()
+
+
+def test_name_to_smiles_caching(requested_urls, tmp_path):
+    """Successful lookups are cached in memory and on disk."""
+    from baybe.settings import Settings
+
+    with Settings(cache_directory=tmp_path):
+        assert chemistry.name_to_smiles("ethanol") == "CCO"
+        assert chemistry.name_to_smiles("ethanol") == "CCO"
+        assert len(requested_urls) == 1
+
+        # After clearing the in-memory cache, the result is loaded from disk
+        chemistry._resolve_name_to_smiles.cache_clear()
+        assert chemistry.name_to_smiles("ethanol") == "CCO"
+        assert len(requested_urls) == 1
+
+
+@pytest.mark.parametrize("use_disk", [False, True], ids=["memory", "disk"])
+def test_name_to_smiles_failures_not_cached(requested_urls, tmp_path, use_disk):
+    """Failed lookups are not cached and are retried on the next request."""
+    from baybe.settings import Settings
+
+    with Settings(cache_directory=tmp_path if use_disk else None):
+        assert chemistry.name_to_smiles("unknown compound") == ""
+        assert chemistry.name_to_smiles("unknown compound") == ""
+    assert len(requested_urls) == 2
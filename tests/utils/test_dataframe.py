@@ -13,6 +13,9 @@ from baybe.targets import BinaryTarget, NumericalTarget
 from baybe.utils.dataframe import (
     add_noise_to_perturb_degenerate_rows,
     add_parameter_noise,
+    df_drop_single_value_columns,
+    df_drop_string_columns,
+    df_uncorrelated_features,
     fuzzy_row_match,
     handle_missing_values,
     normalize_input_dtypes,
@@ -245,3 +248,53 @@ def test_input_dtype(data, warning, match, parameters, targets):
     # Asserts converted columns have expected dtypes
     assert pd.api.types.is_float_dtype(converted["Num_disc_1"]), (data, converted)
     assert pd.api.types.is_float_dtype(converted["Target_max"]), (data, converted)
+
+
+def test_uncorrelated_features():
+    """Columns are greedily dropped based on their correlation with kept columns."""
+    x = np.linspace(0, 1, 20)
+    df = pd.DataFrame(
+        {
+            "a": x,
+            "b": x + 0.05 * np.sin(50 * x),  # highly correlated with "a"
+            "c": np.cos(10 * x),  # weakly correlated with "a"
+            "d": 1.0,  # constant, i.e. undefined correlation
+            "e": -x,  # perfectly anti-correlated with "a"
+        }
+    )
+    assert df_uncorrelated_features(df).columns.tolist() == ["a", "c"]
+
+    # Excluded columns are not considered but retained in the output
+    out = df_uncorrelated_features(df, exclude_list=["a"])
+    assert out.columns.tolist() == ["b", "c", "a"]
+
+
+def test_drop_single_value_columns():
+    """Constant columns are dropped unless explicitly excluded."""
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1, 1, 1],
+            "c": [np.nan, 1, 1],  # missing values do not count as distinct values
+            "d": ["x", "y", "x"],
+            "e": [0, 0, 0],
+        }
+    )
+    assert df_drop_single_value_columns(df).columns.tolist() == ["a", "d"]
+    assert df_drop_single_value_columns(df, ["e"]).columns.tolist() == ["a", "d", "e"]
+
+
+def test_drop_string_columns():
+    """Columns containing strings are dropped unless explicitly ignored."""
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0],
+            "b": ["x", "y", "z"],
+            "c": [1, "y", None],  # mixed types
+            "d": pd.Series(["x", "y", "x"], dtype="category"),
+            "e": [True, False, True],
+            "f": [None, 1.0, 2],  # object column without strings
+        }
+    )
+    assert df_drop_string_columns(df).columns.tolist() == ["a", "e", "f"]
+    assert df_drop_string_columns(df, ["b"]).columns.tolist() == ["a", "b", "e", "f"]
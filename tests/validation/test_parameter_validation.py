@@ -146,6 +146,7 @@ def test_invalid_values_task_parameter(values, active_values, error):
         param(
             {"A": "C", "B": "X", "C": "Y"}, None, ExceptionGroup, id="invalid_smiles"
         ),
+        param({"A": "C", "B": ["CC"]}, None, ExceptionGroup, id="unhashable_smiles"),
         param(
             {"A": "CC", "B": "C-C", "C": "CCO", "D": "OCC"},
             None,
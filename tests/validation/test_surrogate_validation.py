@@ -0,0 +1,53 @@
+"""Validation tests for surrogates."""
+
+import pytest
+
+from baybe.surrogates import GaussianProcessSurrogate, RandomForestSurrogate
+from baybe.surrogates.validation import validate_custom_architecture_cls
+
+
+@pytest.mark.parametrize(
+    "surrogate_cls", [GaussianProcessSurrogate, RandomForestSurrogate]
+)
+def test_valid_architecture_signatures(surrogate_cls):
+    """Architectures with the required method signatures are accepted."""
+    validate_custom_architecture_cls(surrogate_cls)
+
+
+class _KeywordOnlyFit:
+    def _fit(self, train_x, train_y, *, extra=None):
+        pass
+
+    def _posterior(self, candidates_comp_scaled, /):
+        pass
+
+
+def test_keyword_only_arguments_are_ignored():
+    """Only positional arguments are compared, so keyword-only ones are accepted."""
+    validate_custom_architecture_cls(_KeywordOnlyFit)
+
+
+class _InvalidFit:
+    def _fit(self, x, y):
+        pass
+
+    def _posterior(self, candidates_comp_scaled, /):
+        pass
+
+
+class _InvalidPosterior:
+    def _fit(self, train_x, train_y):
+        pass
+
+    def _posterior(self, candidates):
+        pass
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "method"),
+    [(_InvalidFit, "_fit"), (_InvalidPosterior, "_posterior")],
+)
+def test_invalid_architecture_signatures(model_cls, method):
+    """Architectures with non-matching method signatures are rejected."""
+    with pytest.raises(ValueError, match=f"Invalid args in `{method}`"):
+        validate_custom_architecture_cls(model_cls)